@@ -59,14 +59,19 @@ def main(host, port):
             notification_sender_auth = PushNotificationSenderAuth()
             notification_sender_auth.generate_jwk()
 
+        task_manager = AgentTaskManager(agent=MyCustomAgent(), notification_sender_auth=notification_sender_auth)
+
         # Initialize server
         server = A2AServer(
             agent_card=agent_card,
-            task_manager=AgentTaskManager(agent=MyCustomAgent(), notification_sender_auth=notification_sender_auth),
+            task_manager=task_manager,
             host=host,
             port=port
         )
 
+        # Release the invoke worker pool when the server stops
+        server.app.add_event_handler("shutdown", task_manager.shutdown)
+
         # (Optional) Add JWKS endpoint
         if notification_sender_auth:
             server.app.add_route(
@@ -1,7 +1,8 @@
 import os
 import json
-import random
+import secrets
 import logging
+from functools import cached_property
 from typing import Any, Dict, Optional, AsyncIterable, Literal
 from pydantic import BaseModel
 from dotenv import load_dotenv
@@ -23,9 +24,16 @@ class BaseAgent:
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
     SYSTEM_INSTRUCTION: str = "You are a helpful AI agent."
 
-    def __init__(self):
-        self._agent = self._build_agent()
-        self._runner = self._build_runner()
+    # Built lazily on first access so constructing the agent (e.g. for the
+    # AgentCard or --help) doesn't pay for the underlying framework wiring.
+
+    @cached_property
+    def _agent(self):
+        return self._build_agent()
+
+    @cached_property
+    def _runner(self):
+        return self._build_runner()
 
     def _build_agent(self):
         """Initialize and return an agent (e.g., LLM, LangChain, or Google ADK agent)."""
@@ -69,9 +77,11 @@ class BaseAgent:
 # --- Example Tool (can be extended per use case) ---
 def create_generic_form(fields: Dict[str, Any], defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Generate a form template with default values if not provided."""
-    form_id = "form_" + str(random.randint(100000, 999999))
+    form_id = f"form_{secrets.token_hex(4)}"
     defaults = defaults or {}
+    # The conditional is lazy, so no placeholder string is built for
+    # defaulted fields, and the caller's field order is preserved.
     return {
         "form_id": form_id,
-        **{field: defaults.get(field, f"<{field}>") for field in fields}
+        **{field: defaults[field] if field in defaults else f"<{field}>" for field in fields}
     }
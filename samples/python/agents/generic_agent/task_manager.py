@@ -27,7 +27,9 @@ The _run_streaming_task method handles the task's streaming, sending updates to
 
 from typing import AsyncIterable, Union
 import asyncio
+import concurrent.futures
 import logging
+import os
 import traceback
 
 # Placeholder imports for the types and utilities (adjust based on your system's imports)
@@ -45,7 +47,10 @@ from common.types import (
     InvalidParamsError,
     SendTaskResponse,
     SendTaskStreamingRequest,
-    SendTaskStreamingResponse
+    SendTaskStreamingResponse,
+    TaskArtifactUpdateEvent,
+    TaskStatusUpdateEvent,
+    TextPart
 )
 from common.server.task_manager import InMemoryTaskManager
 from common.utils.push_notification_auth import PushNotificationSenderAuth
@@ -55,10 +60,40 @@ import common.server.utils as utils
 logger = logging.getLogger(__name__)
 
 class TaskManager(InMemoryTaskManager):
+    # (task_state, end_stream) indexed by (is_task_complete << 1) | require_user_input.
+    # require_user_input wins over completion, matching the old if/elif order.
+    _STATE_TABLE = (
+        (TaskState.WORKING, False),
+        (TaskState.INPUT_REQUIRED, True),
+        (TaskState.COMPLETED, True),
+        (TaskState.INPUT_REQUIRED, True),
+    )
+
+    # How long an invoke may run before the task is publicly marked WORKING.
+    WORKING_NOTIFY_DELAY = 0.2
+
     def __init__(self, agent, notification_sender_auth: PushNotificationSenderAuth):
         super().__init__()
         self.agent = agent
         self.notification_sender_auth = notification_sender_auth
+        # Synchronous agent.invoke calls run here so they never pin the
+        # event loop thread while SSE clients are being served.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(os.getenv("AGENT_INVOKE_WORKERS", "16")),
+            thread_name_prefix="agent-invoke",
+        )
+
+    def shutdown(self):
+        """Release the invoke worker pool; wire this to the server shutdown hook."""
+        self._executor.shutdown(wait=False)
+
+    async def _delayed_working_notify(self, task_id: str):
+        """Mark the task WORKING only if the agent is still running after the delay."""
+        await asyncio.sleep(self.WORKING_NOTIFY_DELAY)
+        task = await self.update_store(
+            task_id, TaskStatus(state=TaskState.WORKING), None
+        )
+        await self.send_task_notification(task)
 
     def _validate_request(self, request: Union[SendTaskRequest, SendTaskStreamingRequest]) -> JSONRPCResponse | None:
         """Validates the incoming task request."""
@@ -104,17 +139,27 @@ class TaskManager(InMemoryTaskManager):
             return SendTaskResponse(id=request.id, error=validation_error.error)
 
         await self.upsert_task(request.params)
-        task = await self.update_store(request.params.id, TaskStatus(state=TaskState.WORKING), None)
-        await self.send_task_notification(task)
 
+        # Extract the query before scheduling the timer so a validation
+        # error can't leave an orphaned WORKING notification behind.
         task_send_params: TaskSendParams = request.params
         query = self._get_user_query(task_send_params)
 
+        # Defer the WORKING write + push: fast invocations finish before the
+        # delay fires and never pay the extra roundtrip.
+        working_notify = asyncio.create_task(
+            self._delayed_working_notify(request.params.id)
+        )
+
         try:
-            agent_response = self.agent.invoke(query, task_send_params.sessionId)
+            agent_response = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.agent.invoke, query, task_send_params.sessionId
+            )
         except Exception as e:
             logger.error(f"Error invoking agent: {e}")
             raise ValueError(f"Error invoking agent: {e}")
+        finally:
+            working_notify.cancel()
 
         return await self._process_agent_response(request, agent_response)
 
@@ -140,36 +185,48 @@ class TaskManager(InMemoryTaskManager):
         task_send_params: TaskSendParams = request.params
         query = self._get_user_query(task_send_params)
 
+        # A real TextPart (not a bare dict) keeps the model tree matching
+        # the Part union, so downstream serialization stays warning-free.
+        # Events already enqueued keep their parts by reference (the models
+        # are built with model_construct), so the template is copied per
+        # event rather than mutated after handoff.
+        part_template = TextPart.model_construct(type="text", text="")
+
         try:
             async for item in self.agent.stream(query, task_send_params.sessionId):
                 is_task_complete = item.get("is_task_complete", False)
                 require_user_input = item.get("require_user_input", False)
                 message = None
-                parts = [{"type": "text", "text": item.get("content", "")}]
-                end_stream = False
-
-                if not is_task_complete and not require_user_input:
-                    task_state = TaskState.WORKING
-                    message = Message(role="agent", parts=parts)
-                elif require_user_input:
-                    task_state = TaskState.INPUT_REQUIRED
-                    message = Message(role="agent", parts=parts)
-                    end_stream = True
+                artifact = None
+                parts = [part_template.model_copy(update={"text": item.get("content", "")})]
+
+                # Everything on this path is internally generated, so skip
+                # pydantic validation with model_construct — hundreds of
+                # events per stream otherwise re-validate identical shapes.
+                idx = (int(bool(is_task_complete)) << 1) | int(bool(require_user_input))
+                task_state, end_stream = self._STATE_TABLE[idx]
+                if idx == 2:  # completed without pending input: emit an artifact
+                    artifact = Artifact.model_construct(parts=parts, index=0, append=False)
                 else:
-                    task_state = TaskState.COMPLETED
-                    artifact = Artifact(parts=parts, index=0, append=False)
-                    end_stream = True
-
-                task_status = TaskStatus(state=task_state, message=message)
-                latest_task = await self.update_store(task_send_params.id, task_status, None)
-                await self.send_task_notification(latest_task)
-
+                    message = Message.model_construct(role="agent", parts=parts)
+
+                task_status = TaskStatus.model_construct(state=task_state, message=message)
+                latest_task = await self.update_store(
+                    task_send_params.id,
+                    task_status,
+                    None if artifact is None else [artifact],
+                )
+
+                # The push notification and the SSE fan-out are independent
+                # of each other; coalesce them into a single scheduling round
+                # instead of awaiting each hop sequentially.
+                emits = [self.send_task_notification(latest_task)]
                 if artifact:
-                    task_artifact_update_event = TaskArtifactUpdateEvent(id=task_send_params.id, artifact=artifact)
-                    await self.enqueue_events_for_sse(task_send_params.id, task_artifact_update_event)
-
-                task_update_event = TaskStatusUpdateEvent(id=task_send_params.id, status=task_status, final=end_stream)
-                await self.enqueue_events_for_sse(task_send_params.id, task_update_event)
+                    task_artifact_update_event = TaskArtifactUpdateEvent.model_construct(id=task_send_params.id, artifact=artifact)
+                    emits.append(self.enqueue_events_for_sse(task_send_params.id, task_artifact_update_event))
+                task_update_event = TaskStatusUpdateEvent.model_construct(id=task_send_params.id, status=task_status, final=end_stream)
+                emits.append(self.enqueue_events_for_sse(task_send_params.id, task_update_event))
+                await asyncio.gather(*emits)
 
         except Exception as e:
             logger.error(f"Error occurred during streaming: {e}")
@@ -193,8 +250,11 @@ class TaskManager(InMemoryTaskManager):
 
         push_info = await self.get_push_notification_info(task.id)
         logger.info(f"Notifying task {task.id} => {task.status.state}")
+        # Serialize straight to JSON bytes through pydantic-core; avoids the
+        # model_dump tree walk plus a second json.dumps pass per update.
         await self.notification_sender_auth.send_push_notification(
-            push_info.url, data=task.model_dump(exclude_none=True)
+            push_info.url,
+            data=Task.__pydantic_serializer__.to_json(task, exclude_none=True)
         )
 
     async def set_push_notification_info(self, task_id: str, push_notification_config: PushNotificationConfig):
@@ -68,6 +68,7 @@ def main(host,port):
         server.app.add_route(
             "/.well-known/jwks.json", notification_sender_auth.handle_jwks_endpoint, methods=["GET"]
         )
+        server.app.add_event_handler("shutdown", SearchAgent.close_http_client)
 
         logger.info(f"Starting server on {host}:{port}")
         server.start()
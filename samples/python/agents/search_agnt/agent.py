@@ -1,4 +1,7 @@
+import asyncio
+import hashlib
 import os
+from functools import cached_property
 from typing import Any, Dict, AsyncIterable, Literal
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
@@ -6,7 +9,7 @@ from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_core.messages import AIMessage, ToolMessage
 from langchain.agents import AgentExecutor, create_openai_tools_agent
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationTokenBufferMemory
 from pydantic import BaseModel
 
 import httpx
@@ -20,6 +23,26 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+# One HTTP/2-capable client shared by every SearchAgent instance, so TLS
+# handshakes are amortized across queries and requests multiplex over a
+# single connection.
+_HTTP_CLIENT = httpx.AsyncClient(
+    verify=certifi.where(),
+    http2=True,
+    limits=httpx.Limits(
+        max_keepalive_connections=50,
+        max_connections=100,
+        keepalive_expiry=30.0,
+    ),
+    timeout=httpx.Timeout(30.0, connect=5.0),
+)
+
+
+def _query_cache_key(query: str) -> str:
+    """Deterministic cache key for a user query (case/whitespace insensitive)."""
+    return hashlib.blake2b(query.strip().lower().encode()).hexdigest()
+
+
 class ResponseFormat(BaseModel):
     status: Literal["input_required", "completed", "error"] = "input_required"
     message: str
@@ -35,35 +58,100 @@ class SearchAgent:
         "Set response status to completed if the query is answered successfully."
     )
 
+    CACHE_MAXSIZE = 1024
+
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4")
-        # Initialize Tavily tool with SSL verification disabled
-        client = httpx.AsyncClient(verify=certifi.where())
-        self.tools = [TavilySearchResults(client=client)]
-        self.prompt = ChatPromptTemplate.from_messages([
+        # Response cache keyed by (query_hash, sessionId); repeat questions
+        # skip the LLM/tool chain entirely.
+        self._response_cache: Dict[tuple, Dict[str, Any]] = {}
+        # Singleflight map: concurrent identical queries join the first
+        # call's future instead of fanning out N LLM/tool invocations.
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    # The LangChain wiring below is deliberately lazy: constructing the
+    # agent (for the AgentCard, or just to print --help) should not pay
+    # for LLM clients, tools, and the executor until a query arrives.
+
+    @cached_property
+    def llm(self):
+        return ChatOpenAI(model="gpt-4")
+
+    @cached_property
+    def tools(self):
+        return [TavilySearchResults(client=_HTTP_CLIENT)]
+
+    @cached_property
+    def prompt(self):
+        # Stable prefix first (system, then history), user input last, so
+        # provider prompt-prefix caching stays valid across turns.
+        return ChatPromptTemplate.from_messages([
             ("system", self.SYSTEM_INSTRUCTION),
+            MessagesPlaceholder(variable_name="chat_history", optional=True),
             ("human", "{input}"),
             MessagesPlaceholder(variable_name="agent_scratchpad", optional=True)
         ])
-        self.agent = create_openai_tools_agent(self.llm, self.tools, self.prompt)
-        self.agent_executor = AgentExecutor(
+
+    @cached_property
+    def agent(self):
+        return create_openai_tools_agent(self.llm, self.tools, self.prompt)
+
+    @cached_property
+    def agent_executor(self):
+        return AgentExecutor(
             agent=self.agent,
             tools=self.tools,
-            memory=ConversationBufferMemory(memory_key="chat_history", return_messages=True,output_key="output"),
+            # Token-bounded history: long sessions no longer grow the prompt
+            # (and the LLM bill) without limit.
+            memory=ConversationTokenBufferMemory(
+                llm=self.llm,
+                max_token_limit=2000,
+                memory_key="chat_history",
+                return_messages=True,
+                output_key="output"
+            ),
             verbose=True
         )
 
-    def invoke(self, query: str, sessionId: str) -> Dict[str, Any]:
+    async def invoke(self, query: str, sessionId: str, no_cache: bool = False) -> Dict[str, Any]:
         print(f"[DEBUG] Invoking with query: {query}, sessionId: {sessionId}")
         logger.info("*******************************INSIDE INVOKE************************************")
-        config = {"configurable": {"thread_id": sessionId}}
-        result = self.agent_executor.invoke({"input": query}, config)
-
-        print(f"[DEBUG] Agent raw result: {result}")
-
-        logger.info("*************************RESULT*************************************")
-
-        return self.process_response(result)
+        cache_key = (_query_cache_key(query), sessionId)
+        if not no_cache and cache_key in self._response_cache:
+            logger.info(f"Cache hit for query: {query}")
+            return self._response_cache[cache_key]
+
+        flight_key = cache_key[0]
+        if not no_cache and flight_key in self._inflight:
+            logger.info(f"Joining in-flight invocation for query: {query}")
+            return await asyncio.shield(self._inflight[flight_key])
+
+        future = asyncio.get_running_loop().create_future()
+        if not no_cache:
+            # no_cache callers bypass singleflight entirely; registering
+            # their future would clobber a concurrent default caller's.
+            self._inflight[flight_key] = future
+        try:
+            config = {"configurable": {"thread_id": sessionId}}
+            result = await self.agent_executor.ainvoke({"input": query}, config)
+
+            print(f"[DEBUG] Agent raw result: {result}")
+
+            logger.info("*************************RESULT*************************************")
+
+            response = self.process_response(result)
+            if not no_cache and response["is_task_complete"]:
+                if len(self._response_cache) >= self.CACHE_MAXSIZE:
+                    self._response_cache.pop(next(iter(self._response_cache)))
+                self._response_cache[cache_key] = response
+            future.set_result(response)
+            return response
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved; joiners still re-raise on await
+            raise
+        finally:
+            if self._inflight.get(flight_key) is future:
+                del self._inflight[flight_key]
 
     async def stream(self, query: str, sessionId: str) -> AsyncIterable[Dict[str, Any]]:
         # logger.info(f"[DEBUG] Invoking with query: {query}, sessionId: {sessionId}")
@@ -127,3 +215,8 @@ class SearchAgent:
              }
 
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
+
+    @staticmethod
+    async def close_http_client():
+        """Close the shared HTTP client; wire this to the server shutdown hook."""
+        await _HTTP_CLIENT.aclose()
@@ -41,11 +41,22 @@ logger = logging.getLogger(__name__)
 
 
 class AgentTaskManager(InMemoryTaskManager):
+    # How long an invoke may run before the task is publicly marked WORKING.
+    WORKING_NOTIFY_DELAY = 0.2
+
     def __init__(self, agent: SearchAgent, notification_sender_auth: PushNotificationSenderAuth):
         super().__init__()
         self.agent = agent
         self.notification_sender_auth = notification_sender_auth
 
+    async def _delayed_working_notify(self, task_id: str):
+        """Mark the task WORKING only if the agent is still running after the delay."""
+        await asyncio.sleep(self.WORKING_NOTIFY_DELAY)
+        task = await self.update_store(
+            task_id, TaskStatus(state=TaskState.WORKING), None
+        )
+        await self.send_task_notification(task)
+
     async def _run_streaming_agent(self, request: SendTaskStreamingRequest):
         task_send_params: TaskSendParams = request.params
         query = self._get_user_query(task_send_params)
@@ -140,19 +151,26 @@ class AgentTaskManager(InMemoryTaskManager):
                 return SendTaskResponse(id=request.id, error=InvalidParamsError(message="Push notification URL is invalid"))
 
         await self.upsert_task(request.params)
-        task = await self.update_store(
-            request.params.id, TaskStatus(state=TaskState.WORKING), None
-        )
-        await self.send_task_notification(task)
 
+        # Extract the query before scheduling the timer so a validation
+        # error can't leave an orphaned WORKING notification behind.
         task_send_params: TaskSendParams = request.params
         query = self._get_user_query(task_send_params)
+
+        # Defer the WORKING write + push: cache hits and fast invocations
+        # finish before the delay fires and never pay the extra roundtrip.
+        working_notify = asyncio.create_task(
+            self._delayed_working_notify(request.params.id)
+        )
+
         try:
             logger.info("Calling agent.invoke()")
-            agent_response = self.agent.invoke(query, task_send_params.sessionId)
+            agent_response = await self.agent.invoke(query, task_send_params.sessionId)
         except Exception as e:
             logger.error(f"Error invoking agent: {e}")
             raise ValueError(f"Error invoking agent: {e}")
+        finally:
+            working_notify.cancel()
         return await self._process_agent_response(
             request, agent_response
         )
@@ -228,9 +246,11 @@ class AgentTaskManager(InMemoryTaskManager):
         push_info = await self.get_push_notification_info(task.id)
 
         logger.info(f"Notifying for task {task.id} => {task.status.state}")
+        # Serialize straight to JSON bytes through pydantic-core; avoids the
+        # model_dump tree walk plus a second json.dumps pass per update.
         await self.notification_sender_auth.send_push_notification(
             push_info.url,
-            data=task.model_dump(exclude_none=True)
+            data=Task.__pydantic_serializer__.to_json(task, exclude_none=True)
         )
 
     async def on_resubscribe_to_task(
@@ -1,15 +1,53 @@
+import asyncio
+import hashlib
 import os
+import re
 from typing import Any, Dict, AsyncIterable, Literal
 from dotenv import load_dotenv
 from pydantic import BaseModel
-import mysql.connector
-import pandas as pd
+from cachetools import TTLCache
+import aiomysql
 import logging
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+ROW_LIMIT = 10
+
+# Reject pathological inputs before running any regex over them.
+MAX_QUERY_LENGTH = 4096
+
+_LIMIT_RE = re.compile(r'\blimit\b', re.IGNORECASE)
+
+# Read-only statements: SELECT or a WITH ... SELECT CTE, optionally behind
+# leading /* ... */ or -- comments.
+_SELECT_RE = re.compile(
+    r'^\s*(?:/\*.*?\*/\s*|--[^\n]*\n\s*)*(?:select|with)\b',
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _query_cache_key(query: str) -> str:
+    """Deterministic cache key for a SQL query (case/whitespace insensitive)."""
+    return hashlib.blake2b(query.strip().lower().encode()).hexdigest()
+
+
+def _format_rows(columns, rows) -> str:
+    """Render rows as an aligned text table, like DataFrame.to_string."""
+    table = [[str(v) for v in row] for row in rows]
+    widths = [
+        max(len(name), *(len(row[i]) for row in table))
+        for i, name in enumerate(columns)
+    ]
+    lines = [" ".join(name.rjust(widths[i]) for i, name in enumerate(columns))]
+    lines.extend(
+        " ".join(value.rjust(widths[i]) for i, value in enumerate(row))
+        for row in table
+    )
+    return "\n".join(lines)
+
+
 class ResponseFormat(BaseModel):
     status: Literal["input_required", "completed", "error"] = "input_required"
     message: str
@@ -31,8 +69,29 @@ class SQLAgent:
         self.user = os.getenv("DB_USER")
         self.password = os.getenv("DB_PASSWORD")
         self.database = os.getenv("DB_NAME")
+        # Pool creation needs a running event loop, so it is deferred to
+        # the first invoke(). The handshake cost is still paid once per slot.
+        self._pool = None
+        # Short-lived response cache keyed by (query_hash, sessionId); a TTL
+        # keeps repeat queries cheap without serving stale data forever.
+        self._response_cache = TTLCache(maxsize=512, ttl=300)
+        # Singleflight map: concurrent identical queries join the first
+        # call's future instead of each hitting the database.
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def _ensure_pool(self) -> aiomysql.Pool:
+        if self._pool is None:
+            self._pool = await aiomysql.create_pool(
+                minsize=1,
+                maxsize=8,
+                host=self.host,
+                user=self.user,
+                password=self.password,
+                db=self.database
+            )
+        return self._pool
 
-    def invoke(self, query: str, sessionId: str) -> Dict[str, Any]:
+    async def invoke(self, query: str, sessionId: str, no_cache: bool = False) -> Dict[str, Any]:
         logger.info(f"Invoking SQLAgent with query: {query}, sessionId: {sessionId}")
         if not self._is_valid_query(query):
             return {
@@ -40,26 +99,57 @@ class SQLAgent:
                 "require_user_input": True,
                 "content": "Only SELECT queries are allowed. Please rephrase your query."
             }
+        cache_key = (_query_cache_key(query), sessionId)
+        if not no_cache and cache_key in self._response_cache:
+            logger.info(f"Cache hit for query: {query}")
+            return self._response_cache[cache_key]
+        flight_key = cache_key[0]
+        if not no_cache and flight_key in self._inflight:
+            logger.info(f"Joining in-flight query: {query}")
+            return await asyncio.shield(self._inflight[flight_key])
+        future = asyncio.get_running_loop().create_future()
+        if not no_cache:
+            # no_cache callers bypass singleflight entirely; registering
+            # their future would clobber a concurrent default caller's.
+            self._inflight[flight_key] = future
         try:
-            conn = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
-            df = pd.read_sql(query, conn)
-            conn.close()
-            if df.empty:
+            response = await self._run_query(query, cache_key, no_cache)
+            future.set_result(response)
+            return response
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved; joiners still re-raise on await
+            raise
+        finally:
+            if self._inflight.get(flight_key) is future:
+                del self._inflight[flight_key]
+
+    async def _run_query(self, query: str, cache_key: tuple, no_cache: bool) -> Dict[str, Any]:
+        try:
+            pool = await self._ensure_pool()
+            # Cap the result server-side so we never materialize more than
+            # the rows we actually display.
+            if not _LIMIT_RE.search(query):
+                query = f"{query.rstrip().rstrip(';')} LIMIT {ROW_LIMIT}"
+            async with pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(query)
+                    rows = await cursor.fetchmany(ROW_LIMIT)
+                    columns = [desc[0] for desc in cursor.description]
+            if not rows:
                 return {
                     "is_task_complete": False,
                     "require_user_input": True,
                     "content": "No results found. Please try a different query."
                 }
-            return {
+            response = {
                 "is_task_complete": True,
                 "require_user_input": False,
-                "content": df.head(10).to_string(index=False)
+                "content": _format_rows(columns, rows)
             }
+            if not no_cache:
+                self._response_cache[cache_key] = response
+            return response
         except Exception as e:
             logger.error(f"SQLAgent error: {e}")
             return {
@@ -69,7 +159,17 @@ class SQLAgent:
             }
 
     async def stream(self, query: str, sessionId: str) -> AsyncIterable[Dict[str, Any]]:
-        yield self.invoke(query, sessionId)
+        yield {
+            "is_task_complete": False,
+            "require_user_input": False,
+            "content": "Running query..."
+        }
+        yield await self.invoke(query, sessionId)
 
     def _is_valid_query(self, query: str) -> bool:
-        return query.strip().lower().startswith("select")
+        if len(query) > MAX_QUERY_LENGTH:
+            return False
+        if _SELECT_RE.match(query) is None:
+            return False
+        # Reject multi-statement payloads such as "SELECT ...; DROP ...".
+        return ";" not in query.rstrip().rstrip(";")
@@ -1,5 +1,5 @@
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from sse_starlette.sse import EventSourceResponse
 from starlette.requests import Request
 from common.types import (
@@ -19,6 +19,7 @@ from common.types import (
 )
 from pydantic import ValidationError
 import json
+import orjson
 from typing import AsyncIterable, Any
 from common.server.task_manager import TaskManager
 
@@ -41,6 +42,13 @@ class A2AServer:
         self.endpoint = endpoint
         self.task_manager = task_manager
         self.agent_card = agent_card
+        # The agent card is immutable after startup; serialize it once so
+        # discovery polls don't pay pydantic serialization per request.
+        self._agent_card_bytes = (
+            agent_card.model_dump_json(exclude_none=True).encode("utf-8")
+            if agent_card is not None
+            else None
+        )
         self.app = Starlette()
         self.app.add_route(self.endpoint, self._process_request, methods=["POST"])
         self.app.add_route(
@@ -56,10 +64,19 @@ class A2AServer:
 
         import uvicorn
 
-        uvicorn.run(self.app, host=self.host, port=self.port)
+        # uvloop's C event loop is considerably faster than the default
+        # selector loop for SSE/HTTP workloads; fall back where it is
+        # unavailable (e.g. Windows).
+        try:
+            import uvloop  # noqa: F401
+            loop = "uvloop"
+        except ImportError:
+            loop = "auto"
+
+        uvicorn.run(self.app, host=self.host, port=self.port, loop=loop)
 
-    def _get_agent_card(self, request: Request) -> JSONResponse:
-        return JSONResponse(self.agent_card.model_dump(exclude_none=True))
+    def _get_agent_card(self, request: Request) -> Response:
+        return Response(self._agent_card_bytes, media_type="application/json")
 
     async def _process_request(self, request: Request):
         try:
@@ -109,8 +126,14 @@ class A2AServer:
         if isinstance(result, AsyncIterable):
 
             async def event_generator(result) -> AsyncIterable[dict[str, str]]:
+                # orjson is a C extension and considerably faster than the
+                # pydantic json path for the per-event SSE framing.
                 async for item in result:
-                    yield {"data": item.model_dump_json(exclude_none=True)}
+                    yield {
+                        "data": orjson.dumps(
+                            item.model_dump(exclude_none=True)
+                        ).decode()
+                    }
 
             return EventSourceResponse(event_generator(result))
         elif isinstance(result, JSONRPCResponse):
@@ -261,15 +261,27 @@ class InMemoryTaskManager(TaskManager):
         self, request_id, task_id, sse_event_queue: asyncio.Queue
     ) -> AsyncIterable[SendTaskStreamingResponse] | JSONRPCResponse:
         try:
-            while True:                
-                event = await sse_event_queue.get()
-                if isinstance(event, JSONRPCError):
-                    yield SendTaskStreamingResponse(id=request_id, error=event)
-                    break
-                                                
-                yield SendTaskStreamingResponse(id=request_id, result=event)
-                if isinstance(event, TaskStatusUpdateEvent) and event.final:
-                    break
+            finished = False
+            while not finished:
+                batch = [await sse_event_queue.get()]
+                # Drain whatever is already queued so a burst of updates is
+                # flushed in one scheduling round instead of one await each.
+                while len(batch) < 16:
+                    try:
+                        batch.append(sse_event_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                for event in batch:
+                    if isinstance(event, JSONRPCError):
+                        yield SendTaskStreamingResponse(id=request_id, error=event)
+                        finished = True
+                        break
+
+                    yield SendTaskStreamingResponse(id=request_id, result=event)
+                    if isinstance(event, TaskStatusUpdateEvent) and event.final:
+                        finished = True
+                        break
         finally:
             async with self.subscriber_lock:
                 if task_id in self.task_sse_subscribers:
@@ -67,34 +67,55 @@ class PushNotificationSenderAuth(PushNotificationAuth):
             "keys": self.public_keys
         })
     
-    def _generate_jwt(self, data: dict[str, Any]):
+    def _generate_jwt(self, body_sha256: str):
         """JWT is generated by signing both the request payload SHA digest and time of token generation.
 
         Payload is signed with private key and it ensures the integrity of payload for client.
         Including iat prevents from replay attack.
         """
-        
+
         iat = int(time.time())
 
         return jwt.encode(
-            {"iat": iat, "request_body_sha256": self._calculate_request_body_sha256(data)},
+            {"iat": iat, "request_body_sha256": body_sha256},
             key=self.private_key_jwk,
             headers={"kid": self.private_key_jwk.key_id},
             algorithm="RS256"
         )
 
-    async def send_push_notification(self, url: str, data: dict[str, Any]):
-        jwt_token = self._generate_jwt(data)
-        headers = {'Authorization': f"Bearer {jwt_token}"}
-        async with httpx.AsyncClient(timeout=10) as client: 
+    async def send_push_notification(self, url: str, data: dict[str, Any] | bytes):
+        """Send a signed push notification.
+
+        `data` may be a dict, or compact JSON already encoded to bytes
+        (e.g. via pydantic-core's to_json) so hot callers skip the dict
+        materialization and the extra json.dumps pass.
+        """
+        if isinstance(data, (bytes, bytearray)):
+            body = bytes(data)
+        else:
+            # Same canonical form as _calculate_request_body_sha256, but
+            # serialized once and reused as the wire payload.
+            body = json.dumps(
+                data,
+                ensure_ascii=False,
+                allow_nan=False,
+                indent=None,
+                separators=(",", ":"),
+            ).encode()
+        jwt_token = self._generate_jwt(hashlib.sha256(body).hexdigest())
+        headers = {
+            'Authorization': f"Bearer {jwt_token}",
+            'Content-Type': "application/json",
+        }
+        async with httpx.AsyncClient(timeout=10) as client:
             try:
                 response = await client.post(
                     url,
-                    json=data,
+                    content=body,
                     headers=headers
                 )
                 response.raise_for_status()
-                logger.info(f"Push-notification sent for URL: {url}")                            
+                logger.info(f"Push-notification sent for URL: {url}")
             except Exception as e:
                 logger.warning(f"Error during sending push-notification for URL {url}: {e}")
 
@@ -301,6 +301,77 @@ class TestInMemoryTaskManager(unittest.IsolatedAsyncioTestCase):
             self.assertIsInstance(response.error, JSONRPCError)
             break
 
+    async def test_dequeue_events_for_sse_batch_drain(self):
+        task_id = "test_task"
+        request_id = "1"
+        sse_queue = await self.task_manager.setup_sse_consumer(task_id)
+        events = [
+            TaskStatusUpdateEvent(
+                id=task_id, final=False, status=TaskStatus(state=TaskState.WORKING)
+            ),
+            TaskStatusUpdateEvent(
+                id=task_id, final=False, status=TaskStatus(state=TaskState.WORKING)
+            ),
+            TaskStatusUpdateEvent(
+                id=task_id, final=True, status=TaskStatus(state=TaskState.COMPLETED)
+            ),
+        ]
+        for event in events:
+            await self.task_manager.enqueue_events_for_sse(task_id, event)
+        responses = [
+            response
+            async for response in self.task_manager.dequeue_events_for_sse(
+                request_id, task_id, sse_queue
+            )
+        ]
+        self.assertEqual(len(responses), 3)
+        for response, event in zip(responses, events):
+            self.assertIsInstance(response, SendTaskStreamingResponse)
+            self.assertEqual(response.result, event)
+        self.assertTrue(responses[-1].result.final)
+
+    async def test_dequeue_events_for_sse_error_mid_batch(self):
+        task_id = "test_task"
+        request_id = "1"
+        sse_queue = await self.task_manager.setup_sse_consumer(task_id)
+        error_event = JSONRPCError(code=1, message="Test Error")
+        trailing_event = TaskStatusUpdateEvent(
+            id=task_id, final=False, status=TaskStatus(state=TaskState.WORKING)
+        )
+        await self.task_manager.enqueue_events_for_sse(task_id, error_event)
+        await self.task_manager.enqueue_events_for_sse(task_id, trailing_event)
+        responses = [
+            response
+            async for response in self.task_manager.dequeue_events_for_sse(
+                request_id, task_id, sse_queue
+            )
+        ]
+        # The error terminates the stream; queued events behind it are dropped.
+        self.assertEqual(len(responses), 1)
+        self.assertIsInstance(responses[0].error, JSONRPCError)
+
+    async def test_dequeue_events_for_sse_final_mid_batch(self):
+        task_id = "test_task"
+        request_id = "1"
+        sse_queue = await self.task_manager.setup_sse_consumer(task_id)
+        final_event = TaskStatusUpdateEvent(
+            id=task_id, final=True, status=TaskStatus(state=TaskState.COMPLETED)
+        )
+        trailing_event = TaskStatusUpdateEvent(
+            id=task_id, final=False, status=TaskStatus(state=TaskState.WORKING)
+        )
+        await self.task_manager.enqueue_events_for_sse(task_id, final_event)
+        await self.task_manager.enqueue_events_for_sse(task_id, trailing_event)
+        responses = [
+            response
+            async for response in self.task_manager.dequeue_events_for_sse(
+                request_id, task_id, sse_queue
+            )
+        ]
+        # final=True terminates the stream even with events queued behind it.
+        self.assertEqual(len(responses), 1)
+        self.assertEqual(responses[0].result, final_event)
+
     async def test_dequeue_events_for_sse_cleanup(self):
         task_id = "test_task"
         request_id = "1"
@@ -0,0 +1,81 @@
+"""Regression tests for the generic agent's streaming task manager."""
+import unittest
+
+from agents.generic_agent.task_manager import TaskManager
+from common.types import (
+    Message,
+    SendTaskStreamingRequest,
+    TaskArtifactUpdateEvent,
+    TaskSendParams,
+    TaskState,
+    TaskStatusUpdateEvent,
+    TextPart,
+)
+
+
+class StubStreamingAgent:
+    """Minimal agent emitting a WORKING update followed by a completion."""
+
+    SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
+
+    async def stream(self, query, session_id):
+        yield {
+            "is_task_complete": False,
+            "require_user_input": False,
+            "content": "Working on it",
+        }
+        yield {
+            "is_task_complete": True,
+            "require_user_input": False,
+            "content": "All done",
+        }
+
+
+class TestRunStreamingTask(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.task_manager = TaskManager(
+            agent=StubStreamingAgent(), notification_sender_auth=None
+        )
+
+    async def test_working_then_completion_event_sequence(self):
+        # A WORKING item used to raise UnboundLocalError on `artifact` and
+        # tear down the stream before any event reached subscribers.
+        task_id = "stream_task"
+        params = TaskSendParams(
+            id=task_id, message=Message(role="user", parts=[TextPart(text="hi")])
+        )
+        request = SendTaskStreamingRequest(id="1", params=params)
+        await self.task_manager.upsert_task(params)
+        sse_queue = await self.task_manager.setup_sse_consumer(task_id)
+
+        await self.task_manager._run_streaming_task(request)
+
+        events = []
+        while not sse_queue.empty():
+            events.append(sse_queue.get_nowait())
+
+        self.assertEqual(len(events), 3)
+        self.assertIsInstance(events[0], TaskStatusUpdateEvent)
+        self.assertEqual(events[0].status.state, TaskState.WORKING)
+        self.assertFalse(events[0].final)
+        self.assertIsInstance(events[1], TaskArtifactUpdateEvent)
+        self.assertEqual(events[1].artifact.parts[0].text, "All done")
+        self.assertIsInstance(events[2], TaskStatusUpdateEvent)
+        self.assertEqual(events[2].status.state, TaskState.COMPLETED)
+        self.assertTrue(events[2].final)
+
+    async def test_completion_artifact_persisted_on_task(self):
+        task_id = "artifact_task"
+        params = TaskSendParams(
+            id=task_id, message=Message(role="user", parts=[TextPart(text="hi")])
+        )
+        request = SendTaskStreamingRequest(id="1", params=params)
+        await self.task_manager.upsert_task(params)
+        await self.task_manager.setup_sse_consumer(task_id)
+
+        await self.task_manager._run_streaming_task(request)
+
+        task = self.task_manager.tasks[task_id]
+        self.assertEqual(task.status.state, TaskState.COMPLETED)
+        self.assertEqual(len(task.artifacts), 1)
+        self.assertEqual(task.artifacts[0].parts[0].text, "All done")
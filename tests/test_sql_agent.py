@@ -0,0 +1,52 @@
+"""Tests for the SQLAgent SELECT-only query validator."""
+import pytest
+
+from agents.sql_agent.agent import SQLAgent, MAX_QUERY_LENGTH
+
+
+@pytest.fixture
+def agent():
+    return SQLAgent()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM movies",
+        "select title from movies where year > 2000",
+        "  SELECT 1",
+        "WITH top AS (SELECT * FROM movies LIMIT 5) SELECT * FROM top",
+        "with top as (select 1) select * from top",
+        "/* leading comment */ SELECT 1",
+        "-- leading comment\nSELECT 1",
+        "/* one */ /* two */\nSELECT 1",
+        "SELECT * FROM movies;",
+        "SELECT * FROM movies;  ",
+    ],
+)
+def test_is_valid_query_accepts_read_only(agent, query):
+    assert agent._is_valid_query(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "DROP TABLE movies",
+        "UPDATE movies SET title = 'x'",
+        "DELETE FROM movies",
+        "INSERT INTO movies VALUES (1)",
+        "SELECT 1; DROP TABLE movies",
+        "SELECT 1;DROP TABLE movies;",
+        "/* comment */ DROP TABLE movies",
+        "-- comment\nDROP TABLE movies",
+        "",
+        "   ",
+    ],
+)
+def test_is_valid_query_rejects_mutations_and_multi_statements(agent, query):
+    assert not agent._is_valid_query(query)
+
+
+def test_is_valid_query_rejects_oversized_input(agent):
+    padding = "x" * MAX_QUERY_LENGTH
+    assert not agent._is_valid_query(f"SELECT '{padding}'")